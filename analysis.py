@@ -16,18 +16,19 @@ import matplotlib.pyplot as plt
 import numpy as np
 from connectM_game import ConnectMGame
 import os
+from multiprocessing import Pool
+
+# Position of each game outcome along the last axis of the results array.
+OUTCOMES = ('AI #1 WINS', 'AI #2 WINS', 'draw')
 
 def simulate_computer_move(game, player, depth):
-		if player == 1:
-				move = game.alphaBetaSearch(depth)
-				if move is not None:
-						game.makeMove(move, game.computer_symbol)
-		else:
-				game.computer_symbol, game.human_symbol = game.human_symbol, game.computer_symbol
-				move = game.alphaBetaSearch(depth)
-				if move is not None:
-						game.makeMove(move, game.computer_symbol)
-				game.computer_symbol, game.human_symbol = game.human_symbol, game.computer_symbol
+		symbol = game.computer_symbol if player == 1 else game.human_symbol
+		# Each AI searches with its own search tables: a shared transposition table would
+		# let the shallower AI reuse the deeper AI's results and skew the sweep.
+		game.selectSearchTables(player)
+		move = game.alphaBetaSearch(depth, symbol)
+		if move is not None:
+				game.makeMove(move, symbol)
 
 def simulate_game(board_size, connect_m, human_first, depth1, depth2, max_moves=None):
 		if max_moves is None:
@@ -53,51 +54,59 @@ def simulate_game(board_size, connect_m, human_first, depth1, depth2, max_moves=
 		else:
 				return 'draw'
 
+def _run_one(task):
+		# Worker entry point: each process plays its games on its own ConnectMGame instances.
+		board_size, depth1, depth2 = task
+		outcome = simulate_game(board_size, board_size, True, depth1, depth2)
+		return board_size, depth1, depth2, outcome
+
 def run_parameter_sweep():
 		board_sizes = [3, 4, 5, 6]
 		depths_ai1 = [1, 2, 3, 4]
 		depths_ai2 = [1, 2, 3, 4]
 		first_move_flags = [True]
 
-		results = {size: np.empty((4, 4), dtype=object) for size in board_sizes}
+		# results[board_idx, depth1 - 1, depth2 - 1] holds the (AI #1 wins, AI #2 wins, draws) counts.
+		results = np.zeros((len(board_sizes), len(depths_ai1), len(depths_ai2), len(OUTCOMES)), dtype=np.int16)
 		num_games = 3
 
-		for board_size in board_sizes:
+		# Every game is independent, so play them all in parallel across the available cores.
+		# The search is deterministic (same first player, no random tie-breaking), so all
+		# num_games games of one parameter set end the same way: play each set once and
+		# count its outcome num_games times.
+		tasks = [(board_size, depth1, depth2)
+						 for board_size in board_sizes
+						 for depth1 in depths_ai1
+						 for depth2 in depths_ai2]
+		with Pool() as pool:
+				for board_size, depth1, depth2, outcome in pool.imap_unordered(_run_one, tasks, chunksize=4):
+						results[board_sizes.index(board_size), depth1-1, depth2-1, OUTCOMES.index(outcome)] += num_games
+
+		for board_idx, board_size in enumerate(board_sizes):
 				for depth1 in depths_ai1:
 						for depth2 in depths_ai2:
-								outcomes = {'AI #1 WINS': 0, 'AI #2 WINS': 0, 'draw': 0}
-								for _ in range(num_games):
-										outcome = simulate_game(board_size, board_size, True, depth1, depth2)
-										outcomes[outcome] += 1
-								results[board_size][depth1-1, depth2-1] = (outcomes['AI #1 WINS'], outcomes['AI #2 WINS'], outcomes['draw'])
-								print(f'Board: {board_size}x{board_size}, Depths: {depth1} vs {depth2}, Outcomes: {outcomes}')
+								counts = dict(zip(OUTCOMES, results[board_idx, depth1-1, depth2-1].tolist()))
+								print(f'Board: {board_size}x{board_size}, Depths: {depth1} vs {depth2}, Outcomes: {counts}')
 
-		generate_combined_visual(results)
+		generate_combined_visual(results, board_sizes)
 
-def generate_combined_visual(results):
+def generate_combined_visual(results, boards):
 		fig, axes = plt.subplots(2, 3, figsize=(18, 10))
-		boards = list(results.keys())
 
 		for idx, board in enumerate(boards):
 				row = idx // 3
 				col = idx % 3
-				outcomes = results[board]
-
-				ai1_wins = np.array([[outcome[0] for outcome in row] for row in outcomes])
-				ai2_wins = np.array([[outcome[1] for outcome in row] for row in outcomes])
-				draws = np.array([[outcome[2] for outcome in row] for row in outcomes])
+				outcomes = results[idx]
 
-				combined_data = np.zeros_like(ai1_wins, dtype=int)
-				combined_data[draws == 3] = 0  # Draws
-				combined_data[ai1_wins > ai2_wins] = 1  # AI #1 wins
-				combined_data[ai2_wins > ai1_wins] = -1  # AI #2 wins
+				# 1 where AI #1 won more games, -1 where AI #2 did, 0 otherwise (draws).
+				combined_data = np.sign(outcomes[:, :, 0] - outcomes[:, :, 1]).astype(int)
 
 				cmap = plt.colormaps.get_cmap('bwr').resampled(3)
 
 				ax = axes[row, col]
 				cax = ax.matshow(combined_data, cmap=cmap, vmin=-1, vmax=1)
 				for (i, j), val in np.ndenumerate(combined_data):
-						outcome = outcomes[i][j]
+						outcome = outcomes[i, j]
 						if val == 0:
 								ax.text(j, i, f'D:{outcome[2]}', ha='center', va='center', color='black')
 						else:
@@ -112,7 +121,7 @@ def generate_combined_visual(results):
 				ax.set_ylabel("AI #1 Depth")
 				ax.set_title(f'{board}x{board} Board')
 
-		draws = [sum(outcome[2] for row in results[board] for outcome in row) for board in boards]
+		draws = results[:, :, :, 2].sum(axis=(1, 2))
 		ax = axes[1, 2]
 		ax.bar([f'{b}x{b}' for b in boards], draws, color='gray')
 		ax.set_title('Total Draws by Board Size')
@@ -11,7 +11,76 @@ adversarial search with alpha-beta pruning.
 
 '''
 
-import copy  # Import the copy module to make deep copies of the game board when needed.
+import random  # Import the random module to generate the Zobrist hashing keys.
+
+# Bound flags stored with each transposition table entry.
+TT_EXACT = 0  # The stored score is the exact value of the position.
+TT_LOWER = 1  # The stored score is a lower bound (the search failed high).
+TT_UPPER = 2  # The stored score is an upper bound (the search failed low).
+
+# Seed of the generator for the Zobrist hashing keys.
+ZOBRIST_SEED = 0
+
+# Maximum number of positions kept in a transposition table before it is cleared.
+TT_LIMIT = 2000000
+
+# Minimum remaining search depth at which the static pruning margin is applied.
+PRUNE_MIN_DEPTH = 3
+
+# Default static pruning margin, in the units of the heuristic (see segmentScore): 20
+# disks' worth of segment score at 10 points per disk. Smaller margins (e.g. 100 or 150)
+# were measured to cut more nodes but to pick worse moves than plain alpha-beta on
+# connect-3 boards.
+PRUNE_MARGIN = 20 * 10
+
+# Half-width of the aspiration window placed around the previous iteration's score.
+ASPIRATION_WINDOW = 50
+
+def makeWinChecker(win_shifts, connect_m):
+	'''
+	Generates a win check specialized for one board size and win condition.
+
+	Each direction is checked with shifts and ANDs over the whole board at once: after
+	ANDing bb with itself shifted by 1..connect_m-1 steps, a bit is left set only at the
+	first cell of a complete line. Lines that would wrap around a board edge are ruled out
+	by the direction's mask of valid starting cells. This takes 4 * (connect_m - 1)
+	integer operations no matter how many lines the board has.
+
+	The generated function has these chains unrolled, with the shifts and start masks
+	written in as constants, so a call is a single expression with no loop counters or
+	tuple unpacking. For example, on a 3x3 board with connect_m = 3 the horizontal chain
+	reads (bb & 0x49 & bb >> 1 & bb >> 2): only the first column can start a line.
+
+	@param win_shifts: Tuple of (shift, start_mask) pairs, one per direction.
+	@param connect_m: The number of disks that must be connected to win the game.
+	@return: Function taking an integer bitboard and returning True if it holds a winning sequence.
+	'''
+	chains = []
+	for shift, start_mask in win_shifts:
+		terms = ['bb & {:#x}'.format(start_mask)] + ['bb >> {}'.format(step * shift) for step in range(1, connect_m)]
+		chains.append('(' + ' & '.join(terms) + ')')
+	source = 'def checkWin(bb):\n\treturn bool({})\n'.format(' or '.join(chains) or 'False')
+	namespace = {}
+	exec(source, namespace)
+	return namespace['checkWin']
+
+def segmentScore(comp_count, human_count):
+	'''
+	Computes the heuristic score of one line of connect_m cells (see ConnectMGame.lines).
+
+	A line that holds disks of only one player is worth 10 points per disk, positive for
+	the computer and negative for the human; a line holding both players' disks is
+	blocked and worth nothing. Wins are scored separately by the caller.
+
+	@param comp_count: Number of the computer's disks in the line.
+	@param human_count: Number of the human's disks in the line.
+	@return: Integer score of the line.
+	'''
+	# If both players have disks in the segment, it is blocked.
+	if comp_count and human_count:
+		return 0
+	# Empty segments add zero.
+	return 10 * (comp_count - human_count)
 
 class ConnectMGame:
 	'''
@@ -21,11 +90,24 @@ class ConnectMGame:
 	win/draw detection, and the adversarial search algorithm (alpha-beta pruning)
 	to choose the best move for the computer.
 
+	The board is stored as two bitboards (Python ints), one per player. The cell at
+	(row, col) maps to bit (row * board_size + col), with row 0 being the top row.
+	A column-height array tracks how many disks each column holds, so moves can be
+	made and undone in place during the search without copying the board.
+
 	@param board_size: The size (number of rows and columns) of the square game board.
 	@param connect_m: The number of disks that must be connected to win the game.
 	@param human_first: A flag (True/False) indicating if the human moves first.
 	'''
 
+	# Fixed attribute slots: faster attribute access in the search than a per-instance dict.
+	# board is not listed, it is a property built from the bitboards.
+	__slots__ = ('board_size', 'connect_m', 'human_first', 'human_symbol', 'computer_symbol',
+				 'comp_bb', 'human_bb', 'heights', 'valid_mask', 'move_stack', 'lines', 'win_masks', 'win_shifts', 'win_checker',
+				 'all_cells_mask', 'zobrist', 'zobrist_turn', 'hash', 'hash_mirror', 'reflect_table', 'tt', 'tt_limit',
+				 'cell_lines', 'segment_scores', 'comp_counts', 'human_counts', 'score', 'comp_wins',
+				 'human_wins', 'column_order', 'valid_moves_cache', 'killers', 'history', 'search_tables', 'prune_margin')
+
 	def __init__(self, board_size, connect_m, human_first):
 		'''
 		Initializes the game with the board size, win condition, and first-move flag.
@@ -42,8 +124,261 @@ class ConnectMGame:
 		# Define the symbols for the human and computer players.
 		self.human_symbol = 'X'
 		self.computer_symbol = 'O'
-		# Initialize the board as a 2D list filled with spaces to represent empty cells.
-		self.board = [[' ' for _ in range(board_size)] for _ in range(board_size)]
+		# Initialize one empty bitboard per player (no bits set means no disks).
+		self.comp_bb = 0
+		self.human_bb = 0
+		# Number of disks currently stacked in each column.
+		self.heights = [0] * board_size
+		# Bitmask of the columns that are not full yet: bit c is set while column c has room.
+		self.valid_mask = (1 << board_size) - 1
+		# Columns played so far, most recent last, so moves can be undone.
+		self.move_stack = []
+		# Precompute every possible winning line as the (row, col) cells it covers.
+		# Directions: (0, 1) horizontal, (1, 0) vertical, (1, 1) diagonal, (1, -1) anti-diagonal.
+		# These are also the segments scored by the heuristic evaluation.
+		lines = []
+		for dr, dc in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+			for row in range(board_size):
+				for col in range(board_size):
+					# Skip starting cells whose line would run off the board.
+					end_row = row + dr * (connect_m - 1)
+					end_col = col + dc * (connect_m - 1)
+					if not (0 <= end_row < board_size and 0 <= end_col < board_size):
+						continue
+					lines.append(tuple((row + dr * i, col + dc * i) for i in range(connect_m)))
+		self.lines = tuple(lines)
+		# The same lines as bitmasks of connect_m cells, for the bitboard win check and evaluation.
+		win_masks = []
+		for line in self.lines:
+			mask = 0
+			for row, col in line:
+				mask |= 1 << (row * board_size + col)
+			win_masks.append(mask)
+		self.win_masks = tuple(win_masks)
+		# The same lines grouped by direction for the shift-based win check: the bit shift
+		# between neighbouring cells of a line (1, N, N + 1 or N - 1) and a mask of the
+		# cells where a line in that direction can start.
+		start_masks = {}
+		for line in self.lines:
+			(row, col), (next_row, next_col) = line[0], line[1]
+			shift = (next_row - row) * board_size + (next_col - col)
+			start_masks[shift] = start_masks.get(shift, 0) | 1 << (row * board_size + col)
+		self.win_shifts = tuple(start_masks.items())
+		# The shift-based win check compiled for this board size and win condition.
+		self.win_checker = makeWinChecker(self.win_shifts, connect_m)
+		# Bitmask with every cell set, used to detect a full board.
+		self.all_cells_mask = (1 << (board_size * board_size)) - 1
+		# Zobrist keys: one random 64-bit number per (cell, player), where player 0 is the
+		# computer and player 1 is the human. The hash of a position is the XOR of the keys
+		# of its disks and is updated incrementally as moves are made and undone.
+		# The keys come from a fixed seed so hashes are the same in every run and process.
+		zobrist_rng = random.Random(ZOBRIST_SEED)
+		self.zobrist = [[zobrist_rng.getrandbits(64), zobrist_rng.getrandbits(64)] for _ in range(board_size * board_size)]
+		# Key XORed into the hash when the human is to move, so each side to move gets its own entry.
+		self.zobrist_turn = zobrist_rng.getrandbits(64)
+		self.hash = 0
+		# Hash of the board mirrored left to right, also updated incrementally. A position and
+		# its mirror image have the same value, so they share one transposition table entry
+		# stored under the smaller of the two hashes (see transpositionKey).
+		self.hash_mirror = 0
+		# Reversed bit pattern of every possible row, used to mirror the board left to right.
+		self.reflect_table = [int(format(row, '0{}b'.format(board_size))[::-1], 2) for row in range(1 << board_size)]
+		# Transposition table: hash -> (depth, score, flag, best_move). It is kept across
+		# searches and games, so its memory is bounded by starting over once it holds
+		# tt_limit positions.
+		self.tt = {}
+		self.tt_limit = TT_LIMIT
+		# Incremental evaluation: the indices of the lines through each cell, and a table of
+		# segmentScore(comp_count, human_count) so a move only rescores the lines it touches.
+		cell_lines = [[] for _ in range(board_size * board_size)]
+		for index, line in enumerate(self.lines):
+			for row, col in line:
+				cell_lines[row * board_size + col].append(index)
+		self.cell_lines = tuple(tuple(indices) for indices in cell_lines)
+		self.segment_scores = tuple(tuple(segmentScore(comp_count, human_count) for human_count in range(connect_m + 1))
+									for comp_count in range(connect_m + 1))
+		# Disks of each player in every line, the summed segment scores, and the number of
+		# completed lines per player; all kept up to date by makeMove and unmakeMove.
+		self.comp_counts = [0] * len(self.lines)
+		self.human_counts = [0] * len(self.lines)
+		self.score = 0
+		self.comp_wins = 0
+		self.human_wins = 0
+		# Columns from the center outwards: central columns take part in the most winning lines,
+		# so they are generated (and therefore searched) first.
+		self.column_order = tuple(sorted(range(board_size), key=lambda col: abs(col - board_size // 2)))
+		# Valid moves in column_order for each valid_mask seen so far: valid_mask -> tuple of columns.
+		self.valid_moves_cache = {}
+		# Killer moves: the last two moves that caused a cutoff at each ply of the search.
+		self.killers = [[None, None] for _ in range(board_size * board_size + 1)]
+		# History heuristic: cutoff score accumulated by each column over all searches.
+		self.history = [0] * board_size
+		# Sets of (transposition table, history, killers) by name, for players that must not
+		# share what their searches learn (see selectSearchTables). The tables above are None's.
+		self.search_tables = {None: (self.tt, self.history, self.killers)}
+		# Static pruning margin: nodes with at least PRUNE_MIN_DEPTH plies left whose heuristic
+		# score is this far outside the alpha-beta window are cut off without being searched.
+		# Set to None to disable.
+		self.prune_margin = PRUNE_MARGIN
+
+	@property
+	def board(self):
+		'''
+		Builds a 2D tuple view of the bitboards.
+
+		Each cell holds ' ' for an empty cell or the symbol of the player owning it.
+		The view is a read-only snapshot, so writing a cell in place (board[r][c] = x)
+		raises a TypeError instead of being silently lost. To change cells, copy the rows
+		into lists, edit them and assign the grid back to the board attribute.
+
+		@return: Tuple of row tuples of single-character strings (row 0 is the top row).
+		'''
+		n = self.board_size
+		grid = [[' ' for _ in range(n)] for _ in range(n)]
+		for row in range(n):
+			for col in range(n):
+				bit = 1 << (row * n + col)
+				if self.comp_bb & bit:
+					grid[row][col] = self.computer_symbol
+				elif self.human_bb & bit:
+					grid[row][col] = self.human_symbol
+		return tuple(tuple(row) for row in grid)
+
+	@board.setter
+	def board(self, grid):
+		'''
+		Loads the game state from a 2D grid (lists or tuples) of symbols.
+
+		Column heights are taken from the topmost occupied cell of each column, so a
+		column is only playable while its top cell is empty.
+
+		@param grid: 2D sequence of single-character strings (row 0 is the top row).
+		'''
+		n = self.board_size
+		self.comp_bb = 0
+		self.human_bb = 0
+		self.heights = [0] * n
+		self.move_stack = []
+		for row in range(n):
+			for col in range(n):
+				bit = 1 << (row * n + col)
+				if grid[row][col] == self.computer_symbol:
+					self.comp_bb |= bit
+				elif grid[row][col] == self.human_symbol:
+					self.human_bb |= bit
+				else:
+					continue
+				# The first occupied cell met from the top fixes the column height.
+				if self.heights[col] == 0:
+					self.heights[col] = n - row
+		self.valid_mask = sum(1 << col for col in range(n) if self.heights[col] < n)
+		self.hash = self.computeHash(self.comp_bb, self.human_bb)
+		self.hash_mirror = self.computeHash(self.reflectBitboard(self.comp_bb), self.reflectBitboard(self.human_bb))
+		self.computeLineCounts()
+
+	def reset(self):
+		'''
+		Clears the board for a new game on the same board size and win condition.
+
+		The precomputed tables are reused. The transposition table is kept as well: its
+		entries are keyed by position, so they stay valid in any game (its size is capped
+		at tt_limit positions). The history scores
+		(cutoffs counted per column) are also kept; they only affect the move order.
+		'''
+		self.comp_bb = 0
+		self.human_bb = 0
+		self.heights = [0] * self.board_size
+		self.valid_mask = (1 << self.board_size) - 1
+		self.move_stack = []
+		self.hash = 0
+		self.hash_mirror = 0
+		self.computeLineCounts()
+
+	def selectSearchTables(self, name):
+		'''
+		Switches the search to the transposition table, history scores and killer moves
+		kept under the given name, creating empty ones the first time a name is used.
+
+		Players that search on the same game (e.g. two AIs of different depths) each
+		select their own tables before searching, so neither one reuses the results of
+		the other's searches. The tables are kept by reset().
+
+		@param name: Hashable name of the set of tables, e.g. a player number (None for the default set).
+		'''
+		tables = self.search_tables.get(name)
+		if tables is None:
+			tables = ({}, [0] * self.board_size, [[None, None] for _ in range(self.board_size * self.board_size + 1)])
+			self.search_tables[name] = tables
+		self.tt, self.history, self.killers = tables
+
+	def computeLineCounts(self):
+		'''
+		Recomputes the incremental evaluation state (line counts, score and wins) from scratch.
+		'''
+		self.comp_counts = [(self.comp_bb & mask).bit_count() for mask in self.win_masks]
+		self.human_counts = [(self.human_bb & mask).bit_count() for mask in self.win_masks]
+		self.score = sum(self.segment_scores[comp_count][human_count]
+						 for comp_count, human_count in zip(self.comp_counts, self.human_counts))
+		self.comp_wins = self.comp_counts.count(self.connect_m)
+		self.human_wins = self.human_counts.count(self.connect_m)
+
+	def computeHash(self, comp_bb, human_bb):
+		'''
+		Computes the Zobrist hash of a board from scratch.
+
+		@param comp_bb: Integer bitboard holding the computer's disks.
+		@param human_bb: Integer bitboard holding the human's disks.
+		@return: Integer hash combining the keys of every disk on the board.
+		'''
+		h = 0
+		for cell in range(self.board_size * self.board_size):
+			if comp_bb >> cell & 1:
+				h ^= self.zobrist[cell][0]
+			elif human_bb >> cell & 1:
+				h ^= self.zobrist[cell][1]
+		return h
+
+	def transpositionKey(self, side):
+		'''
+		Computes the transposition table key of the current position.
+
+		The key is the smaller of the hash and the mirrored hash, so a position and its
+		mirror image map to the same entry. Best moves are stored for the orientation
+		of the key and must be mirrored back when the mirrored hash was used.
+
+		@param side: 1 if the computer is to move, -1 if the human is to move.
+		@return: Tuple (key, mirrored): the integer key and True if it is the mirrored hash.
+		'''
+		mirrored = self.hash_mirror < self.hash
+		key = self.hash_mirror if mirrored else self.hash
+		# The human to move has its own entries.
+		if side == -1:
+			key ^= self.zobrist_turn
+		return key, mirrored
+
+	def reflectBitboard(self, bb):
+		'''
+		Mirrors a bitboard left to right (column c becomes column board_size - 1 - c).
+
+		@param bb: Integer bitboard to mirror.
+		@return: Integer bitboard of the mirrored disks.
+		'''
+		n = self.board_size
+		row_mask = (1 << n) - 1
+		reflected = 0
+		# Mirror one row at a time using the precomputed reversed row patterns.
+		for shift in range(0, n * n, n):
+			reflected |= self.reflect_table[(bb >> shift) & row_mask] << shift
+		return reflected
+
+	def isSymmetric(self):
+		'''
+		Checks if the board is the same as its left-to-right mirror image.
+
+		@return: True if both players' disks are symmetric, False otherwise.
+		'''
+		return (self.reflectBitboard(self.comp_bb) == self.comp_bb
+				and self.reflectBitboard(self.human_bb) == self.human_bb)
 
 	def displayBoard(self):
 		'''
@@ -51,30 +386,26 @@ class ConnectMGame:
 
 		It prints a border, then each row of the board with cell values.
 		'''
-		# Print the top border of the board.
-		print('+' + '---+' * self.board_size)
+		# Border printed above the board and after each row.
+		border = '+' + '---+' * self.board_size
+		lines = [border]
 		# Iterate rows of the board.
 		for row in self.board:
-			# Start building the row string with a left border.
-			row_str = '|'
-			# Loop through each cell in the row.
-			for cell in row:
-				# Add the cell value inside a box (with spaces around it).
-				row_str += ' ' + cell + ' |'
-			# Print the row.
-			print(row_str)
-			# Print a border after each row.
-			print('+' + '---+' * self.board_size)
+			# Each cell value sits inside a box (with spaces around it).
+			lines.append('| ' + ' | '.join(row) + ' |')
+			lines.append(border)
+		# Print the whole board at once.
+		print('\n'.join(lines))
 
 	def isValidMove(self, column):
 		'''
 		Checks if a move can be made in the given column.
 
 		@param column: Integer index of the column to check.
-		@return: True if the top cell in the column is empty, False if the column is full.
+		@return: True if the column still has room for a disk, False if the column is full.
 		'''
-		# The move is valid if the top cell of the column is empty (a space).
-		return self.board[0][column] == ' '
+		# The move is valid for a column on the board whose bit in the mask of non-full columns is set.
+		return 0 <= column < self.board_size and bool(self.valid_mask >> column & 1)
 
 	def makeMove(self, column, symbol):
 		'''
@@ -87,17 +418,95 @@ class ConnectMGame:
 		# First, check if the move is valid (i.e., the column is not full).
 		if not self.isValidMove(column):
 			return False
-		# Iterate over the rows starting from the bottom (last index) up to the top.
-		# For example, if board_size = 5, the row indices will be: 4 -> 3 -> 2 -> 1 -> 0
-		for row in range(self.board_size - 1, -1, -1):
-			# Find the first empty cell in the column.
-			if self.board[row][column] == ' ':
-				# Place the disk (set the cell to the player's symbol).
-				self.board[row][column] = symbol
-				# Return True to indicate the move was successful.
-				return True
-		# If no empty cell is found, return False.
-		return False
+		# The disk lands on the lowest empty row of the column.
+		# For example, if board_size = 5 and the column holds 1 disk, it lands on row 3.
+		row = self.board_size - 1 - self.heights[column]
+		cell = row * self.board_size + column
+		bit = 1 << cell
+		# The same cell on the board mirrored left to right.
+		mirror_cell = cell + self.board_size - 1 - 2 * column
+		# Set the bit on the bitboard of the player making the move and update the hashes.
+		# Then rescore only the lines through the new disk.
+		segment_scores = self.segment_scores
+		score = self.score
+		if symbol == self.computer_symbol:
+			self.comp_bb |= bit
+			self.hash ^= self.zobrist[cell][0]
+			self.hash_mirror ^= self.zobrist[mirror_cell][0]
+			comp_counts = self.comp_counts
+			human_counts = self.human_counts
+			for line in self.cell_lines[cell]:
+				comp_count = comp_counts[line]
+				human_count = human_counts[line]
+				score += segment_scores[comp_count + 1][human_count] - segment_scores[comp_count][human_count]
+				comp_counts[line] = comp_count + 1
+				if comp_count + 1 == self.connect_m:
+					self.comp_wins += 1
+		else:
+			self.human_bb |= bit
+			self.hash ^= self.zobrist[cell][1]
+			self.hash_mirror ^= self.zobrist[mirror_cell][1]
+			comp_counts = self.comp_counts
+			human_counts = self.human_counts
+			for line in self.cell_lines[cell]:
+				comp_count = comp_counts[line]
+				human_count = human_counts[line]
+				score += segment_scores[comp_count][human_count + 1] - segment_scores[comp_count][human_count]
+				human_counts[line] = human_count + 1
+				if human_count + 1 == self.connect_m:
+					self.human_wins += 1
+		self.score = score
+		# The column is now one disk taller; remember the move so it can be undone.
+		self.heights[column] += 1
+		if self.heights[column] == self.board_size:
+			self.valid_mask &= ~(1 << column)
+		self.move_stack.append(column)
+		return True
+
+	def unmakeMove(self):
+		'''
+		Undoes the most recent move made with makeMove.
+
+		@return: The column index of the undone move.
+		'''
+		# Take back the last column played; its top disk is the one to remove.
+		column = self.move_stack.pop()
+		self.heights[column] -= 1
+		self.valid_mask |= 1 << column
+		row = self.board_size - 1 - self.heights[column]
+		cell = row * self.board_size + column
+		bit = 1 << cell
+		mirror_cell = cell + self.board_size - 1 - 2 * column
+		# Clear the bit from whichever bitboard owns the disk and update the hashes.
+		# Then undo the rescoring of the lines through the disk.
+		segment_scores = self.segment_scores
+		score = self.score
+		comp_counts = self.comp_counts
+		human_counts = self.human_counts
+		if self.comp_bb & bit:
+			self.comp_bb ^= bit
+			self.hash ^= self.zobrist[cell][0]
+			self.hash_mirror ^= self.zobrist[mirror_cell][0]
+			for line in self.cell_lines[cell]:
+				comp_count = comp_counts[line]
+				human_count = human_counts[line]
+				score += segment_scores[comp_count - 1][human_count] - segment_scores[comp_count][human_count]
+				comp_counts[line] = comp_count - 1
+				if comp_count == self.connect_m:
+					self.comp_wins -= 1
+		else:
+			self.human_bb ^= bit
+			self.hash ^= self.zobrist[cell][1]
+			self.hash_mirror ^= self.zobrist[mirror_cell][1]
+			for line in self.cell_lines[cell]:
+				comp_count = comp_counts[line]
+				human_count = human_counts[line]
+				score += segment_scores[comp_count][human_count - 1] - segment_scores[comp_count][human_count]
+				human_counts[line] = human_count - 1
+				if human_count == self.connect_m:
+					self.human_wins -= 1
+		self.score = score
+		return column
 
 	def checkWin(self, symbol):
 		'''
@@ -106,321 +515,307 @@ class ConnectMGame:
 		@param symbol: Character representing the player's disk.
 		@return: True if the player has a winning set of connected disks, False otherwise.
 		'''
-		# Call the helper function checkWinState on the current board.
-		return self.checkWinState(self.board, symbol)
+		# Call the helper function checkWinState on the player's bitboard.
+		if symbol == self.computer_symbol:
+			return self.checkWinState(self.comp_bb)
+		return self.checkWinState(self.human_bb)
 
-	def checkWinState(self, board, symbol):
+	def checkWinState(self, bb):
 		'''
-		Checks for a win condition on a given board for the specified symbol.
+		Checks for a win condition on a given bitboard.
 
-		@param board: 2D list representing the current board state.
-		@param symbol: Character representing the player's disk.
+		@param bb: Integer bitboard holding one player's disks.
 		@return: True if a winning sequence is found, False otherwise.
 		'''
-		# Define the four directions to check for a winning sequence:
-		#   (0, 1)  -> →  (horizontal right)
-		#   (1, 0)  -> ↓  (vertical down)
-		#   (1, 1)  -> ↘ (diagonal down-right)
-		#   (1, -1) -> ↙ (diagonal down-left)
-		directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
-		# Loop over every cell in the board.
-		for row in range(self.board_size):
-			for col in range(self.board_size):
-				# Only start checking if the cell contains the player's symbol.
-				if board[row][col] == symbol:
-					# For each direction, count how many same-symbol cells are connected.
-					for d in directions:
-						count = 1  # Start with the current cell.
-						# Set the next cell position based on the direction.
-						r = row + d[0]
-						c = col + d[1]
-						# Continue moving in the chosen direction while within board limits.
-						while 0 <= r < self.board_size and 0 <= c < self.board_size and board[r][c] == symbol:
-							count += 1  # Increase the count for each connected disk.
-							# If the count reaches the required number, a win is detected.
-							if count >= self.connect_m:
-								return True
-							# Move to the next cell in the same direction.
-							r += d[0]
-							c += d[1]
-		# If no winning sequence is found, return False.
-		return False
+		return self.win_checker(bb)
 
 	def checkDraw(self):
 		'''
 		Checks if the game is a draw.
 
-		A draw is defined as a board where no valid moves remain (i.e., the top row is full).
+		A draw is defined as a board where no valid moves remain (i.e., every cell is full).
 
 		@return: True if the game is a draw, False otherwise.
 		'''
-		# Loop through every column in the top row.
-		for col in range(self.board_size):
-			# If any column is still empty, then moves can still be made.
-			if self.board[0][col] == ' ':
-				return False
-		# If no columns have empty spaces, the board is full and it's a draw.
-		return True
+		# The board is full when the two bitboards together cover every cell.
+		return (self.comp_bb | self.human_bb) == self.all_cells_mask
 
-	def evaluateBoardState(self, board):
+	def evaluateBoardState(self):
 		'''
-		Provides a heuristic evaluation of the board state.
+		Provides a heuristic evaluation of the current board state.
 
 		This function assigns a high positive value if the computer wins, a high negative
-		value if the human wins, and otherwise scores potential winning segments.
+		value if the human wins, and otherwise scores potential winning segments
+		(see segmentScore). The segment scores are kept up to date as moves are made,
+		so no part of the board is scanned.
 
-		@param board: 2D list representing the board state.
 		@return: Integer score representing the board's heuristic value.
 		'''
-		# Check if the computer has a winning sequence.
-		# Example: For connect_m = 4, if a row has: O O O O => winning sequence.
-		if self.checkWinState(board, self.computer_symbol):
-			return 1000000
-
-		# Check if the human has a winning sequence.
-		# Example: For connect_m = 4, if a row has: X X X X => winning sequence.
-		if self.checkWinState(board, self.human_symbol):
-			return -1000000
-
-		# Start with a score of zero for non-terminal states.
-		score = 0
-
-		# ================================================
-		# Evaluate horizontal segments (rows).
-		# ================================================
-		# Imagine a row on the board as:
-		# [ ' ', 'X', 'O', 'X', ' ' ]
-		# For connect_m = 3, we extract segments like:
-		#   Segment 1: [ ' ', 'X', 'O' ]
-		#   Segment 2: [ 'X', 'O', 'X' ]
-		#   Segment 3: [ 'O', 'X', ' ' ]
-		# Each segment is then evaluated to see how favorable it is.
-		for row in board:
-			for col in range(self.board_size - self.connect_m + 1):
-				segment = row[col:col + self.connect_m]
-				score += self.evaluateSegment(segment)
-
-		# ================================================
-		# Evaluate vertical segments (columns).
-		# ================================================
-		# Consider a column on the board:
-		# [
-		#   ' ',
-		#   'O',
-		#   'X',
-		#   'X',
-		#   'O'
-		# ]
-		# For connect_m = 3, we take segments like:
-		#   Segment 1: [ ' ', 'O', 'X' ]
-		#   Segment 2: [ 'O', 'X', 'X' ]
-		#   Segment 3: [ 'X', 'X', 'O' ]
-		# Each segment is then scored.
-		for col in range(self.board_size):
-			for row in range(self.board_size - self.connect_m + 1):
-				segment = [board[r][col] for r in range(row, row + self.connect_m)]
-				score += self.evaluateSegment(segment)
-
-		# ================================================
-		# Evaluate diagonal segments (top-left to bottom-right).
-		# ================================================
-		# Visualize a portion of the board:
-		# [ A, B, C, D ]
-		# [ E, F, G, H ]
-		# [ I, J, K, L ]
-		# [ M, N, O, P ]
-		#
-		# For connect_m = 3, a diagonal segment starting at cell A (row 0, col 0)
-		# would be: [ A, F, K ]
-		# Similarly, starting at cell B (row 0, col 1) yields: [ B, G, L ]
-		# The code extracts all such diagonals.
-		for row in range(self.board_size - self.connect_m + 1):
-			for col in range(self.board_size - self.connect_m + 1):
-				segment = [board[row + i][col + i] for i in range(self.connect_m)]
-				score += self.evaluateSegment(segment)
-
-		# ================================================
-		# Evaluate anti-diagonal segments (top-right to bottom-left).
-		# ================================================
-		# Using the same board visualization as above:
-		# [ A, B, C, D ]
-		# [ E, F, G, H ]
-		# [ I, J, K, L ]
-		# [ M, N, O, P ]
-		#
-		# For connect_m = 3, an anti-diagonal segment starting at cell D (row 0, col 3)
-		# would be: [ D, G, J ]
-		# Similarly, starting at cell C (row 0, col 2) yields: [ C, F, I ]
-		# The code extracts all such anti-diagonals.
-		for row in range(self.board_size - self.connect_m + 1):
-			for col in range(self.connect_m - 1, self.board_size):
-				segment = [board[row + i][col - i] for i in range(self.connect_m)]
-				score += self.evaluateSegment(segment)
-
-		# Return the total heuristic score for the board.
-		return score
-
-	def evaluateSegment(self, segment):
-		'''
-		Evaluates a segment of cells for potential winning opportunities.
-
-		If the segment contains both players' symbols, it has no potential.
-		Otherwise, segments with only one player's disks are scored exponentially
-		based on the count of disks.
-
-		@param segment: List of cell values (characters).
-		@return: Integer score for the segment.
-		'''
-		# If both players have disks in the segment, it is blocked.
-		if segment.count(self.human_symbol) > 0 and segment.count(self.computer_symbol) > 0:
-			return 0
-		# If only the computer's disks are present, return a positive score.
-		elif segment.count(self.computer_symbol) > 0:
-			return 10* segment.count(self.computer_symbol)
-		# If only the human's disks are present, return a negative score.
-		elif segment.count(self.human_symbol) > 0:
-			return -(10* segment.count(self.human_symbol))
-		else:
-			# If the segment is completely empty, it has no score.
-			return 0
+		return self.evaluateStatus()[0]
 
-	def getValidMoves(self, board):
+	def evaluateStatus(self):
 		'''
-		Generates a list of valid column indices where a move can be made.
+		Evaluates the current board state and checks whether it is terminal.
 
-		@param board: 2D list representing the board state.
-		@return: List of integer column indices that are valid moves.
+		@return: Tuple (score, terminal): the heuristic score (see evaluateBoardState) and
+				True if either player has won or the board is full.
 		'''
-		valid_moves = []
-		# Loop over each column.
-		for col in range(self.board_size):
-			# If the top cell of the column is empty, then the move is valid.
-			if board[0][col] == ' ':
-				valid_moves.append(col)
-		return valid_moves
-
-	def applyMove(self, board, move, symbol):
+		# A computer win takes precedence, as it did when the computer was checked first.
+		if self.comp_wins:
+			return 1000000, True
+		if self.human_wins:
+			return -1000000, True
+		return self.score, (self.comp_bb | self.human_bb) == self.all_cells_mask
+
+	def getValidMoves(self):
 		'''
-		Applies a move on a given board and returns a new board state.
-
-		@param board: 2D list representing the current board.
-		@param move: Integer column index where the disk is to be dropped.
-		@param symbol: Character representing the player's disk.
-		@return: A new board state after applying the move.
-		'''
-		# Create a deep copy of the board to avoid modifying the original board.
-		new_board = copy.deepcopy(board)
-		# Iterate over the rows starting from the bottom (last index) up to the top.
-		# For example, if board_size = 5, the row indices will be: 4 -> 3 -> 2 -> 1 -> 0
-		for row in range(self.board_size - 1, -1, -1):
-			# Find the first empty spot in the selected column.
-			if new_board[row][move] == ' ':
-				# Place the disk.
-				new_board[row][move] = symbol
-				# Once the disk is placed, exit the loop.
-				break
-		# Return the new board state with the move applied.
-		return new_board
+		Generates a list of valid column indices where a move can be made, ordered from
+		the center column outwards.
 
-	def checkTerminal(self, board):
+		@return: List of integer column indices that are valid moves.
+		'''
+		# The valid moves only depend on which columns are full, so they are listed once
+		# per mask of non-full columns and reused.
+		valid_moves = self.valid_moves_cache.get(self.valid_mask)
+		if valid_moves is None:
+			valid_mask = self.valid_mask
+			valid_moves = tuple(col for col in self.column_order if valid_mask >> col & 1)
+			self.valid_moves_cache[valid_mask] = valid_moves
+		return list(valid_moves)
+
+	def checkTerminal(self):
 		'''
-		Determines if the board state is terminal.
+		Determines if the current board state is terminal.
 
 		A terminal state is reached if either player has won or if there are no more valid moves.
 
-		@param board: 2D list representing the board state.
 		@return: True if the state is terminal (win or draw), False otherwise.
 		'''
-		# Check if either player has achieved a win.
-		if self.checkWinState(board, self.computer_symbol) or self.checkWinState(board, self.human_symbol):
-			return True
-		# Check if there are no valid moves remaining.
-		if not self.getValidMoves(board):
-			return True
-		return False
+		# Check if either player has completed a line (counted as moves are made), or if
+		# there are no valid moves remaining (every cell is full).
+		return self.evaluateStatus()[1]
+
+	def orderMoves(self, moves, first_move=None, ply=0):
+		'''
+		Orders moves so the ones most likely to cause alpha-beta cutoffs are tried first.
+
+		The given first move (usually the best move from the transposition table) comes
+		first, then the killer moves of this ply, then the columns with the highest
+		history score. Ties keep the center-out order of getValidMoves.
+
+		@param moves: List of valid column indices.
+		@param first_move: Column index to try before all others, or None.
+		@param ply: Integer distance from the root of the search.
+		@return: New list with the same moves in search order.
+		'''
+		killers = self.killers[ply]
+		history = self.history
+		# sorted() is stable, so moves that tie on every key stay in center-out order.
+		return sorted(moves, key=lambda col: (col != first_move, col not in killers, -history[col]))
+
+	def storeCutoff(self, move, depth, ply):
+		'''
+		Records a move that caused an alpha-beta cutoff, for the killer and history heuristics.
 
-	def alphaBetaSearch(self, depth):
+		@param move: Column index of the move that caused the cutoff.
+		@param depth: Integer remaining search depth at the node.
+		@param ply: Integer distance from the root of the search.
+		'''
+		killers = self.killers[ply]
+		# Keep the two most recent distinct killers for this ply.
+		if killers[0] != move:
+			killers[1] = killers[0]
+			killers[0] = move
+		# Deeper cutoffs save more work, so they count for more.
+		self.history[move] += depth * depth
+
+	def alphaBetaSearch(self, depth, symbol=None):
 		'''
-		Uses the alpha-beta pruning algorithm to choose the best move for the computer.
+		Uses the alpha-beta pruning algorithm to choose the best move for a player.
+
+		The search is iteratively deepened from depth 1 up to the requested depth. Each
+		iteration fills the transposition table, so the next, deeper one can try the best
+		moves found so far first and prune much more of the tree. Each iteration after the
+		first is searched with a narrow (aspiration) window around the previous score, and
+		searched again with the full window if the score falls outside of it.
 
 		@param depth: Integer specifying how many moves ahead to search.
+		@param symbol: Character of the player to move (defaults to the computer).
 		@return: The column index of the best move.
 		'''
+		# On an empty board the center column is the strongest opening, so skip the search
+		# (which would be the deepest of the game).
+		if self.comp_bb == 0 and self.human_bb == 0:
+			return self.board_size // 2
+		# The search works with the side to move: 1 for the computer, -1 for the human.
+		side = -1 if symbol == self.human_symbol else 1
+		best_move = None
+		best_score = None
+		for d in range(1, depth + 1):
+			# Killer moves only apply to the iteration that found them; history is kept.
+			for killers in self.killers:
+				killers[0] = killers[1] = None
+			if best_score is not None:
+				# Expect a score close to the previous one: a narrow window prunes more.
+				alpha = best_score - ASPIRATION_WINDOW
+				beta = best_score + ASPIRATION_WINDOW
+				move, score = self.rootSearch(d, best_move, side, alpha, beta)
+				# Inside the window the score is exact; outside it, it is only a bound and
+				# the move may not be the best one, so search this depth again in full.
+				if alpha < score < beta:
+					best_move, best_score = move, score
+					continue
+			# Keep the move of the last fully completed iteration.
+			best_move, best_score = self.rootSearch(d, best_move, side)
+		return best_move
+
+	def rootSearch(self, depth, first_move=None, side=1, alpha=-float('inf'), beta=float('inf')):
+		'''
+		Searches every move from the current board state to a fixed depth.
+
+		@param depth: Integer specifying how many moves ahead to search.
+		@param first_move: Column index to search first (e.g. the previous iteration's best move).
+		@param side: 1 if the computer is to move, -1 if the human is to move.
+		@param alpha: Lower bound of the search window (full window by default).
+		@param beta: Upper bound of the search window (full window by default).
+		@return: Tuple of the column index of the best move and its score for the player to move.
+		'''
 		# Initialize best score to a very small number and best move to None.
 		best_score = -float('inf')
 		best_move = None
-		# Set initial alpha and beta values.
-		alpha = -float('inf')
-		beta = float('inf')
+		# Remember the window the moves are searched with, to know what kind of bound the result is.
+		alpha_start = alpha
+		# A position and its mirror image share one entry, with the move mirrored as needed.
+		key, mirrored = self.transpositionKey(side)
+		# Prefer the given move, then the best move stored for this position by an earlier search.
+		if first_move is None:
+			entry = self.tt.get(key)
+			if entry is not None and entry[3] is not None:
+				first_move = self.board_size - 1 - entry[3] if mirrored else entry[3]
 		# Get the list of all valid moves from the current board state.
-		valid_moves = self.getValidMoves(self.board)
+		valid_moves = self.getValidMoves()
+		# On a symmetric board, a move and its mirror image are equally good: only search
+		# the left half of the columns (including the center column).
+		if self.isSymmetric():
+			valid_moves = [col for col in valid_moves if 2 * col <= self.board_size - 1]
+		# Search the best candidates first.
+		valid_moves = self.orderMoves(valid_moves, first_move)
+		symbol = self.computer_symbol if side == 1 else self.human_symbol
 		# Loop through each valid move.
 		for move in valid_moves:
-			# Create a new board state by applying the move.
-			new_board = self.applyMove(self.board, move, self.computer_symbol)
-			# Evaluate the board state using the minimizer function.
-			score = self.minValue(new_board, alpha, beta, depth - 1)
+			# Play the move on the board, score the opponent's best reply, then take it back.
+			self.makeMove(move, symbol)
+			score = -self.negamax(-beta, -alpha, depth - 1, 1, -side)
+			self.unmakeMove()
 			# If this move has a better score, update best_score and best_move.
 			if score > best_score:
 				best_score = score
 				best_move = move
+			# Stop once the score fails high: it is only a lower bound from here on.
+			if best_score >= beta:
+				break
 			# Update alpha value.
 			alpha = max(alpha, best_score)
-		# Return the column index of the best move found.
-		return best_move
-
-	def maxValue(self, board, alpha, beta, depth):
+		# Store the result with the bound it represents (exact with the full window).
+		if best_move is not None:
+			if best_score <= alpha_start:
+				flag = TT_UPPER
+			elif best_score >= beta:
+				flag = TT_LOWER
+			else:
+				flag = TT_EXACT
+			if len(self.tt) >= self.tt_limit:
+				self.tt.clear()
+			self.tt[key] = (depth, best_score, flag, self.board_size - 1 - best_move if mirrored else best_move)
+		# Return the best move found and its score.
+		return best_move, best_score
+
+	def negamax(self, alpha, beta, depth, ply, side):
 		'''
-		The maximizer function in the alpha-beta pruning algorithm.
+		The alpha-beta pruning algorithm in negamax form.
+
+		Scores are always from the point of view of the player to move, so one function
+		serves both players: a move's score is the negated score of the opponent's reply,
+		searched with the negated and swapped (alpha, beta) window.
+
+		Works on the current board state; every move tried is undone before returning.
+		Results are stored in the transposition table and reused for later visits.
 
-		@param board: 2D list representing the board state.
-		@param alpha: The best already explored option along the path to the root for the maximizer.
-		@param beta: The best already explored option along the path to the root for the minimizer.
+		@param alpha: The best already explored option for the player to move.
+		@param beta: The best already explored option for the opponent (negated).
 		@param depth: Integer representing the remaining search depth.
-		@return: The maximum heuristic score for the board state.
+		@param ply: Integer distance from the root of the search.
+		@param side: 1 if the computer is to move, -1 if the human is to move.
+		@return: The heuristic score of the board state for the player to move.
 		'''
+		# Look up the position, or its mirror image, in the transposition table (see
+		# transpositionKey). An entry searched at least as deep is either returned directly
+		# or used to narrow the alpha-beta window.
+		tt = self.tt
+		key, mirrored = self.transpositionKey(side)
+		entry = tt.get(key)
+		if entry is not None and entry[0] >= depth:
+			if entry[2] == TT_EXACT:
+				return entry[1]
+			if entry[2] == TT_LOWER:
+				alpha = max(alpha, entry[1])
+			else:
+				beta = min(beta, entry[1])
+			if alpha >= beta:
+				return entry[1]
 		# If we've reached the desired depth or a terminal state, evaluate the board.
-		if depth == 0 or self.checkTerminal(board):
-			return self.evaluateBoardState(board)
+		# The evaluation is from the computer's point of view.
+		score, terminal = self.evaluateStatus()
+		if depth == 0 or terminal:
+			return side * score
+		# Far from the leaves, trust a static score that is clearly outside the window:
+		# fail high if it beats beta by the margin, fail low if it is below alpha by the margin.
+		if depth >= PRUNE_MIN_DEPTH and self.prune_margin is not None:
+			score *= side
+			if score - self.prune_margin >= beta or score + self.prune_margin <= alpha:
+				return score
 		# Start with the lowest possible value.
 		value = -float('inf')
-		# Loop through all valid moves.
-		for move in self.getValidMoves(board):
-			# Apply the move for the computer.
-			new_board = self.applyMove(board, move, self.computer_symbol)
-			# Recursively call minValue to evaluate the opponent's best response.
-			value = max(value, self.minValue(new_board, alpha, beta, depth - 1))
+		best_move = None
+		# Remember the window the moves are searched with, to know what kind of bound the result is.
+		alpha_start = alpha
+		# The stored best move is searched first, mirrored back if the entry is for the mirror image.
+		first_move = None
+		if entry is not None and entry[3] is not None:
+			first_move = self.board_size - 1 - entry[3] if mirrored else entry[3]
+		symbol = self.computer_symbol if side == 1 else self.human_symbol
+		# Bind the methods called for every move to locals once per node.
+		make_move = self.makeMove
+		unmake_move = self.unmakeMove
+		negamax = self.negamax
+		# Loop through all valid moves, starting with the best move stored for this position.
+		for move in self.orderMoves(self.getValidMoves(), first_move, ply):
+			# Apply the move for the player to move.
+			make_move(move, symbol)
+			# Recursively evaluate the opponent's best response.
+			score = -negamax(-beta, -alpha, depth - 1, ply + 1, -side)
+			# Take the move back before looking at the next one.
+			unmake_move()
+			if score > value:
+				value = score
+				best_move = move
 			# If the current value is greater than or equal to beta, prune the branch.
 			if value >= beta:
-				return value
+				self.storeCutoff(move, depth, ply)
+				break
 			# Update alpha value.
 			alpha = max(alpha, value)
-		return value
-
-	def minValue(self, board, alpha, beta, depth):
-		'''
-		The minimizer function in the alpha-beta pruning algorithm.
-
-		@param board: 2D list representing the board state.
-		@param alpha: The best already explored option for the maximizer.
-		@param beta: The best already explored option for the minimizer.
-		@param depth: Integer representing the remaining search depth.
-		@return: The minimum heuristic score for the board state.
-		'''
-		# If the depth is zero or the state is terminal, evaluate the board.
-		if depth == 0 or self.checkTerminal(board):
-			return self.evaluateBoardState(board)
-		# Start with the highest possible value.
-		value = float('inf')
-		# Loop through all valid moves.
-		for move in self.getValidMoves(board):
-			# Apply the move for the human.
-			new_board = self.applyMove(board, move, self.human_symbol)
-			# Recursively call maxValue to evaluate the computer's best response.
-			value = min(value, self.maxValue(new_board, alpha, beta, depth - 1))
-			# If the value is less than or equal to alpha, prune the branch.
-			if value <= alpha:
-				return value
-			# Update beta value.
-			beta = min(beta, value)
+		# Store the result with the bound it represents.
+		if value <= alpha_start:
+			flag = TT_UPPER
+		elif value >= beta:
+			flag = TT_LOWER
+		else:
+			flag = TT_EXACT
+		if mirrored and best_move is not None:
+			best_move = self.board_size - 1 - best_move
+		# Bound the memory used by the table by starting over once it gets large.
+		if len(tt) >= self.tt_limit:
+			tt.clear()
+		tt[key] = (depth, value, flag, best_move)
 		return value
@@ -13,42 +13,68 @@ validates parameters, initializes the game, and runs the main game loop.
 import sys  # Import system module for accessing command-line arguments and exiting.
 from connectM_game import ConnectMGame  # Import the game logic class.
 
-def main():
+class UsageError(SystemExit):
+	'''
+	Exception raised by run() for invalid command-line arguments.
+
+	It is a SystemExit with exit status 1, so an uncaught UsageError still ends the
+	program with an error code. The message is printed by main().
+
+	@param message: String describing the error to the user.
+	@param kind: String naming the invalid input: 'usage' (wrong number of arguments),
+			'integer' (non-integer argument), 'N', 'M' or 'H'.
+	'''
+
+	def __init__(self, message, kind):
+		'''
+		Initializes the error with its message and kind.
+
+		@param message: String describing the error to the user.
+		@param kind: String naming the invalid input.
+		'''
+		super().__init__(1)
+		self.message = message
+		self.kind = kind
+
+	def __str__(self):
+		'''
+		@return: The error message (rather than the exit status).
+		'''
+		return self.message
+
+def run(argv):
 	'''
-	Main function to run the Connect M game.
+	Runs the Connect M game with the given command-line arguments.
 
-	This function parses and validates command-line arguments, creates a game instance,
+	This function parses and validates the arguments, creates a game instance,
 	and starts the main game loop where the human and computer take turns.
 
-	@return None
+	@param argv: List of argument strings, without the script name: [N, M, H].
+	@return: Integer exit status 0 once the game is over.
+	@raise UsageError: If the arguments are invalid.
 	'''
-	# Check if the number of command-line arguments is exactly 4:
-	# [script name, board_size (N), connect_m (M), human_first flag (H)]
-	if len(sys.argv) != 4:
-		# If not, print usage information and exit with an error code.
-		print('Usage: python3 main.py <N> <M> <H>')
-		sys.exit(1)
+	# Check if the number of command-line arguments is exactly 3:
+	# [board_size (N), connect_m (M), human_first flag (H)]
+	if len(argv) != 3:
+		# If not, report the usage information.
+		raise UsageError('Usage: python3 main.py <N> <M> <H>', 'usage')
 	try:
 		# Convert the command-line arguments to integers.
-		board_size = int(sys.argv[1])
-		connect_m = int(sys.argv[2])
-		human_first_flag = int(sys.argv[3])
+		board_size = int(argv[0])
+		connect_m = int(argv[1])
+		human_first_flag = int(argv[2])
 	except ValueError:
-		# If conversion fails, print an error message and exit.
-		print('All parameters must be integers.')
-		sys.exit(1)
+		# If conversion fails, report an error.
+		raise UsageError('All parameters must be integers.', 'integer') from None
 	# Validate that the board size is between 3 and 10.
 	if board_size < 3 or board_size > 10:
-		print('Board size N must be between 3 and 10.')
-		sys.exit(1)
+		raise UsageError('Board size N must be between 3 and 10.', 'N')
 	# Validate that connect_m is at least 2 and does not exceed board_size.
 	if connect_m < 2 or connect_m > board_size:
-		print('Parameter M must be higher than 1 and no higher than N.')
-		sys.exit(1)
+		raise UsageError('Parameter M must be higher than 1 and no higher than N.', 'M')
 	# Validate that the human/computer flag is either 0 or 1.
 	if human_first_flag not in [0, 1]:
-		print('Parameter H must be 0 or 1.')
-		sys.exit(1)
+		raise UsageError('Parameter H must be 0 or 1.', 'H')
 
 	# Determine if the human should move first.
 	human_first = True if human_first_flag == 1 else False
@@ -112,6 +138,23 @@ def main():
 			print('Computer places disk in column {}'.format(move + 1))
 			# Switch the turn back to the human player.
 			current_player = 'human'
+	return 0
+
+def main():
+	'''
+	Main function to run the Connect M game from the command line.
+
+	Runs the game with the script's arguments and exits with the resulting status.
+	Invalid arguments are reported on stdout with exit status 1.
+
+	@return None
+	'''
+	try:
+		status = run(sys.argv[1:])
+	except UsageError as error:
+		print(error.message)
+		sys.exit(error.code)
+	sys.exit(status)
 
 # Run the main function only if this script is executed directly.
 if __name__ == '__main__':
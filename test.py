@@ -14,7 +14,10 @@ computer vs. computer to record outcomes.
 import unittest  # Import the unittest framework.
 import subprocess  # Import subprocess to run CLI commands.
 import sys  # Import sys for access to the Python interpreter.
+import os  # Import os to pass a trimmed environment to the CLI subprocess.
+import random  # Import random to generate reproducible move sequences.
 from connectM_game import ConnectMGame  # Import the ConnectMGame class for testing.
+import main  # Import the CLI module to run it in-process.
 
 class TestConnectMGame(unittest.TestCase):
 		'''
@@ -24,19 +27,29 @@ class TestConnectMGame(unittest.TestCase):
 		board evaluation, and the alpha-beta search algorithm.
 		'''
 
+		@classmethod
+		def setUpClass(cls):
+				'''
+				Set up one game instance shared by all tests of this class.
+
+				@return None
+				'''
+				# Define a board size of 5 and winning condition of 4.
+				cls.board_size = 5
+				cls.connect_m = 4
+				# Create a ConnectMGame instance with the human moving first.
+				cls.shared_game = ConnectMGame(cls.board_size, cls.connect_m, True)
+
 		def setUp(self):
 				'''
-				Set up a new game instance for each test.
+				Give each test an empty board.
 
 				This method is run before every test method to ensure a fresh board.
 
 				@return None
 				'''
-				# Define a board size of 5 and winning condition of 4.
-				self.board_size = 5
-				self.connect_m = 4
-				# Create a new ConnectMGame instance with the human moving first.
-				self.game = ConnectMGame(self.board_size, self.connect_m, True)
+				self.game = self.shared_game
+				self.game.reset()
 
 		def test_is_valid_move(self):
 				'''
@@ -45,8 +58,8 @@ class TestConnectMGame(unittest.TestCase):
 				@return None
 				'''
 				# On an empty board, every column should be valid.
-				for col in range(self.board_size):
-						self.assertTrue(self.game.isValidMove(col), f'Column {col} should be valid on an empty board.')
+				self.assertEqual([self.game.isValidMove(col) for col in range(self.board_size)], [True] * self.board_size,
+												 'Every column should be valid on an empty board.')
 
 				# Fill an entire column (e.g., column 2) and ensure it becomes invalid.
 				col_to_fill = 2
@@ -54,6 +67,10 @@ class TestConnectMGame(unittest.TestCase):
 						move_made = self.game.makeMove(col_to_fill, self.game.human_symbol)
 						self.assertTrue(move_made, 'Move should be successful.')
 				self.assertFalse(self.game.isValidMove(col_to_fill), 'Column should be full and invalid for a move.')
+				# Columns off the board are invalid too.
+				self.assertFalse(self.game.isValidMove(-1), 'A negative column should be invalid.')
+				self.assertFalse(self.game.isValidMove(self.board_size), 'A column past the board should be invalid.')
+				self.assertFalse(self.game.makeMove(-1, self.game.human_symbol), 'A move off the board should fail.')
 
 		def test_make_move(self):
 				'''
@@ -67,6 +84,69 @@ class TestConnectMGame(unittest.TestCase):
 				# The disk should appear in the bottom row of column 1.
 				self.assertEqual(self.game.board[self.board_size - 1][col], self.game.human_symbol,
 												 'The disk should be placed at the bottom row.')
+				# The board is a read-only snapshot: writing a cell in place must fail loudly.
+				with self.assertRaises(TypeError):
+						self.game.board[0][col] = self.game.computer_symbol
+
+		def test_unmake_move(self):
+				'''
+				Test that undoing moves restores the previous board state.
+
+				@return None
+				'''
+				self.game.makeMove(2, self.game.human_symbol)
+				board_before = self.game.board
+				position_hash = self.game.hash
+				score = self.game.evaluateBoardState()
+				# Play a few moves, including one stacked on an existing disk, then undo them.
+				self.game.makeMove(2, self.game.computer_symbol)
+				self.game.makeMove(0, self.game.human_symbol)
+				self.assertEqual(self.game.unmakeMove(), 0, 'The last move should be undone first.')
+				self.assertEqual(self.game.unmakeMove(), 2, 'Moves should be undone in reverse order.')
+				self.assertEqual(self.game.board, board_before, 'Undoing moves should restore the board.')
+				self.assertEqual(self.game.hash, position_hash, 'Undoing moves should restore the hash.')
+				self.assertEqual(self.game.evaluateBoardState(), score, 'Undoing moves should restore the evaluation.')
+
+		def test_reset(self):
+				'''
+				Test that resetting the game empties the board.
+
+				@return None
+				'''
+				self.game.makeMove(1, self.game.human_symbol)
+				self.game.makeMove(1, self.game.computer_symbol)
+				self.game.reset()
+				self.assertEqual(self.game.board, ConnectMGame(self.board_size, self.connect_m, True).board,
+												 'Resetting should empty the board.')
+				self.assertEqual(self.game.hash, 0, 'Resetting should clear the hash.')
+				self.assertEqual(self.game.evaluateBoardState(), 0, 'Resetting should clear the evaluation.')
+
+		def test_incremental_evaluation(self):
+				'''
+				Test that the evaluation state kept up to date by makeMove matches a full recompute.
+
+				@return None
+				'''
+				def evaluation_state():
+						return (self.game.score, list(self.game.comp_counts), list(self.game.human_counts),
+										self.game.comp_wins, self.game.human_wins)
+
+				# Stack four human disks in column 0 (completing a vertical line), then fill the
+				# rest of the board with random moves, checking the state after every move.
+				moves = [(0, self.game.human_symbol), (1, self.game.computer_symbol)] * 3 + [(0, self.game.human_symbol)]
+				rng = random.Random(0)
+				symbol = self.game.computer_symbol
+				while len(moves) < self.board_size * self.board_size:
+						moves.append((None, symbol))
+						symbol = self.game.human_symbol if symbol == self.game.computer_symbol else self.game.computer_symbol
+				for col, symbol in moves:
+						if col is None:
+								col = rng.choice(self.game.getValidMoves())
+						self.game.makeMove(col, symbol)
+						incremental = evaluation_state()
+						self.game.computeLineCounts()
+						self.assertEqual(incremental, evaluation_state(), 'The incremental evaluation should match a recompute.')
+				self.assertGreater(self.game.human_wins, 0, 'The moves should complete a line for the human.')
 
 		def test_horizontal_win(self):
 				'''
@@ -76,8 +156,10 @@ class TestConnectMGame(unittest.TestCase):
 				'''
 				# Manually fill a horizontal segment on the bottom row for the human.
 				row = self.board_size - 1
+				board = [list(row) for row in self.game.board]
 				for col in range(self.connect_m):
-						self.game.board[row][col] = self.game.human_symbol
+						board[row][col] = self.game.human_symbol
+				self.game.board = board
 				# Check that the game recognizes the horizontal win.
 				self.assertTrue(self.game.checkWin(self.game.human_symbol), 'Horizontal win should be detected.')
 
@@ -89,8 +171,10 @@ class TestConnectMGame(unittest.TestCase):
 				'''
 				# Manually fill a vertical segment in the first column for the human.
 				col = 0
+				board = [list(row) for row in self.game.board]
 				for row in range(self.connect_m):
-						self.game.board[self.board_size - 1 - row][col] = self.game.human_symbol
+						board[self.board_size - 1 - row][col] = self.game.human_symbol
+				self.game.board = board
 				# Verify that the vertical win is detected.
 				self.assertTrue(self.game.checkWin(self.game.human_symbol), 'Vertical win should be detected.')
 
@@ -101,8 +185,10 @@ class TestConnectMGame(unittest.TestCase):
 				@return None
 				'''
 				# Manually set up a diagonal win for the human.
+				board = [list(row) for row in self.game.board]
 				for i in range(self.connect_m):
-						self.game.board[i][i] = self.game.human_symbol
+						board[i][i] = self.game.human_symbol
+				self.game.board = board
 				self.assertTrue(self.game.checkWin(self.game.human_symbol), 'Diagonal win should be detected.')
 
 		def test_anti_diagonal_win(self):
@@ -112,10 +198,32 @@ class TestConnectMGame(unittest.TestCase):
 				@return None
 				'''
 				# Manually set up an anti-diagonal win for the human.
+				board = [list(row) for row in self.game.board]
 				for i in range(self.connect_m):
-						self.game.board[i][self.board_size - 1 - i] = self.game.human_symbol
+						board[i][self.board_size - 1 - i] = self.game.human_symbol
+				self.game.board = board
 				self.assertTrue(self.game.checkWin(self.game.human_symbol), 'Anti-diagonal win should be detected.')
 
+		def test_win_checker(self):
+				'''
+				Test the generated win check against a line-by-line check for every board size.
+
+				@return None
+				'''
+				rng = random.Random(0)
+				for board_size in range(3, 11):
+						for connect_m in range(2, board_size + 1):
+								game = ConnectMGame(board_size, connect_m, True)
+								for sample in range(50):
+										# Sparse random disks rarely complete a line, so every other board gets a
+										# random winning line added (possibly on top of another one).
+										bb = rng.getrandbits(board_size * board_size) & rng.getrandbits(board_size * board_size)
+										if sample % 2:
+												bb |= rng.choice(game.win_masks)
+										expected = any(bb & mask == mask for mask in game.win_masks)
+										self.assertEqual(game.win_checker(bb), expected,
+																		 f'Wrong win check on a {board_size}x{board_size} board, M={connect_m}, bitboard {bb:#x}.')
+
 		def test_draw(self):
 				'''
 				Test that a full board with no wins is detected as a draw.
@@ -123,12 +231,11 @@ class TestConnectMGame(unittest.TestCase):
 				@return None
 				'''
 				# Fill the board in an alternating pattern to avoid any wins.
+				# Cell number idx (counting row by row) holds symbol_cycle[idx % 2], so there are
+				# only two kinds of rows: one starting with each symbol.
 				symbol_cycle = [self.game.human_symbol, self.game.computer_symbol]
-				idx = 0
-				for row in range(self.board_size):
-						for col in range(self.board_size):
-								self.game.board[row][col] = symbol_cycle[idx % 2]
-								idx += 1
+				row_patterns = [[symbol_cycle[(start + col) % 2] for col in range(self.board_size)] for start in (0, 1)]
+				self.game.board = [row_patterns[row * self.board_size % 2] for row in range(self.board_size)]
 				self.assertTrue(self.game.checkDraw(), 'The game should be detected as a draw when board is full.')
 
 		def test_alpha_beta_search(self):
@@ -144,7 +251,199 @@ class TestConnectMGame(unittest.TestCase):
 				# Use the alpha-beta search to choose a move.
 				move = self.game.alphaBetaSearch(depth=3)
 				# Check that the move is one of the valid moves.
-				self.assertIn(move, self.game.getValidMoves(self.game.board), 'Alpha-beta search should return a valid move.')
+				self.assertIn(move, self.game.getValidMoves(), 'Alpha-beta search should return a valid move.')
+
+		def test_alpha_beta_search_opening(self):
+				'''
+				Test that the alpha-beta search opens in the center column of an empty board.
+
+				@return None
+				'''
+				self.assertEqual(self.game.alphaBetaSearch(depth=4), self.board_size // 2,
+												 'The opening move should be the center column.')
+
+		def negamax_values(self, game, depth, symbol):
+				'''
+				Helper method scoring every move with a plain negamax search (no pruning or tables).
+
+				@param game: The ConnectMGame instance holding the position; it is left unchanged.
+				@param depth: Integer search depth, counting the move itself.
+				@param symbol: Character of the player to move.
+				@return: Dictionary mapping each valid column to its score for the player to move.
+				'''
+				def negamax(depth, side):
+						score, terminal = game.evaluateStatus()
+						if depth == 0 or terminal:
+								return side * score
+						symbol = game.computer_symbol if side == 1 else game.human_symbol
+						best = -float('inf')
+						for col in game.getValidMoves():
+								game.makeMove(col, symbol)
+								best = max(best, -negamax(depth - 1, -side))
+								game.unmakeMove()
+						return best
+
+				side = 1 if symbol == game.computer_symbol else -1
+				values = {}
+				for col in game.getValidMoves():
+						game.makeMove(col, symbol)
+						values[col] = -negamax(depth - 1, -side)
+						game.unmakeMove()
+				return values
+
+		def random_positions(self, board_size, connect_m, count, seed):
+				'''
+				Helper method generating reproducible, non-terminal positions from random play.
+
+				@param board_size: Integer board size of the positions.
+				@param connect_m: Integer win condition of the positions.
+				@param count: Number of positions to generate.
+				@param seed: Seed of the random move choices.
+				@return: List of board grids (as returned by the board property).
+				'''
+				rng = random.Random(seed)
+				game = ConnectMGame(board_size, connect_m, True)
+				positions = []
+				while len(positions) < count:
+						game.reset()
+						symbol = game.human_symbol
+						for _ in range(rng.randint(1, board_size * board_size // 2)):
+								game.makeMove(rng.choice(game.getValidMoves()), symbol)
+								symbol = game.computer_symbol if symbol == game.human_symbol else game.human_symbol
+								if game.checkTerminal():
+										break
+						if not game.checkTerminal():
+								positions.append(game.board)
+				return positions
+
+		def test_static_pruning(self):
+				'''
+				Test the static pruning margin against a plain negamax search.
+
+				Without the margin the search should choose a move as good as the best move of
+				an unpruned search, and with the default margin it should still find a forced win.
+
+				@return None
+				'''
+				depth = 4
+				for grid in self.random_positions(self.board_size, 3, 20, seed=1):
+						game = ConnectMGame(self.board_size, 3, True)
+						game.prune_margin = None
+						game.board = grid
+						values = self.negamax_values(game, depth, game.computer_symbol)
+						move = game.alphaBetaSearch(depth)
+						self.assertEqual(values[move], max(values.values()),
+														 'Without pruning the search should choose a best move.')
+
+				# The computer wins by playing column 3: the human can then only block one end of
+				# the three disks on the bottom row. The win comes 3 plies ahead.
+				game = ConnectMGame(self.board_size, self.connect_m, True)
+				board = [list(row) for row in game.board]
+				board[self.board_size - 1][1] = board[self.board_size - 1][2] = game.computer_symbol
+				board[self.board_size - 2][1] = board[self.board_size - 2][2] = game.human_symbol
+				game.board = board
+				self.assertIsNotNone(game.prune_margin, 'Pruning should be enabled by default.')
+				move = game.alphaBetaSearch(depth=5)
+				self.assertEqual(move, 3, 'The search should find the forced win.')
+				self.assertEqual(self.negamax_values(game, 3, game.computer_symbol)[move], 1000000,
+												 'The chosen move should force a win.')
+
+		def test_search_matches_negamax(self):
+				'''
+				Test that the full search (iterative deepening with aspiration windows and the
+				mirrored transposition table) chooses a best move of a plain negamax search.
+
+				Pruning is disabled so both searches compute the same values. Each position is
+				searched for both players and then mirrored on the same game, so the search also
+				runs on tables holding bounds and mirrored best moves from the earlier searches.
+				(A fresh game is used per position: entries from positions with fewer disks
+				could hold deeper, and thus different, values than a fixed-depth negamax.)
+
+				@return None
+				'''
+				depth = 4
+				for connect_m in (3, self.connect_m):
+						for grid in self.random_positions(self.board_size, connect_m, 15, seed=2):
+								game = ConnectMGame(self.board_size, connect_m, True)
+								game.prune_margin = None
+								chosen = {}
+								for position in (grid, [row[::-1] for row in grid]):
+										for symbol in (game.computer_symbol, game.human_symbol):
+												game.board = position
+												side = 1 if symbol == game.computer_symbol else -1
+												if symbol in chosen and not game.isSymmetric():
+														# The root entry stored for the unmirrored position should give back
+														# the mirror image of the move chosen there. (A symmetric position is
+														# its own mirror image and only has its left-half moves searched.)
+														key, mirrored = game.transpositionKey(side)
+														stored = game.tt[key][3]
+														recovered = self.board_size - 1 - stored if mirrored else stored
+														self.assertEqual(recovered, self.board_size - 1 - chosen[symbol],
+																						 'The stored best move should be mirrored for the mirror image.')
+												values = self.negamax_values(game, depth, symbol)
+												move = game.alphaBetaSearch(depth, symbol)
+												self.assertEqual(values[move], max(values.values()),
+																				 f'The search should choose a best move for {symbol} (M={connect_m}).')
+												chosen[symbol] = move
+
+		def test_select_search_tables(self):
+				'''
+				Test that each named set of search tables is kept apart from the others.
+
+				@return None
+				'''
+				game = ConnectMGame(self.board_size, self.connect_m, True)
+				game.makeMove(0, game.human_symbol)
+				game.selectSearchTables(1)
+				game.alphaBetaSearch(2)
+				tt = game.tt
+				self.assertTrue(tt, 'The search should fill the selected transposition table.')
+				game.selectSearchTables(2)
+				self.assertEqual(game.tt, {}, 'A new name should start with an empty transposition table.')
+				game.selectSearchTables(1)
+				self.assertIs(game.tt, tt, 'Selecting a name again should bring back its tables.')
+
+		def test_transposition_table_limit(self):
+				'''
+				Test that the transposition table never grows past its limit.
+
+				@return None
+				'''
+				game = ConnectMGame(self.board_size, self.connect_m, True)
+				game.tt_limit = 20
+				game.makeMove(0, game.human_symbol)
+				game.alphaBetaSearch(4)
+				self.assertTrue(0 < len(game.tt) <= game.tt_limit, 'The table should be cleared when it reaches its limit.')
+
+		def test_symmetry(self):
+				'''
+				Test that mirrored boards are detected as symmetric.
+
+				@return None
+				'''
+				# The empty board and a center disk are symmetric.
+				self.assertTrue(self.game.isSymmetric(), 'The empty board should be symmetric.')
+				self.game.makeMove(self.board_size // 2, self.game.human_symbol)
+				self.assertTrue(self.game.isSymmetric(), 'A single center disk should be symmetric.')
+				# A disk off the center breaks the symmetry, and its mirror image restores it.
+				self.game.makeMove(0, self.game.computer_symbol)
+				self.assertFalse(self.game.isSymmetric(), 'A disk off the center should not be symmetric.')
+				self.game.makeMove(self.board_size - 1, self.game.computer_symbol)
+				self.assertTrue(self.game.isSymmetric(), 'Mirrored disks should be symmetric.')
+
+		def test_transposition_key_mirror(self):
+				'''
+				Test that a position and its mirror image share a transposition table key.
+
+				@return None
+				'''
+				self.game.makeMove(0, self.game.human_symbol)
+				self.game.makeMove(1, self.game.computer_symbol)
+				key = self.game.transpositionKey(1)[0]
+				# Rebuild the mirror image from scratch through the board setter.
+				self.game.board = [row[::-1] for row in self.game.board]
+				self.assertEqual(self.game.transpositionKey(1)[0], key, 'Mirrored positions should share a key.')
+				self.assertNotEqual(self.game.transpositionKey(-1)[0], key, 'Each side to move should have its own key.')
 
 		def test_evaluate_board_state(self):
 				'''
@@ -153,17 +452,21 @@ class TestConnectMGame(unittest.TestCase):
 				@return None
 				'''
 				# Simulate a winning board for the computer.
+				board = [list(row) for row in self.game.board]
 				for col in range(self.connect_m):
-						self.game.board[self.board_size - 1][col] = self.game.computer_symbol
-				eval_score = self.game.evaluateBoardState(self.game.board)
+						board[self.board_size - 1][col] = self.game.computer_symbol
+				self.game.board = board
+				eval_score = self.game.evaluateBoardState()
 				# The evaluation should be highly positive for a computer win.
 				self.assertGreater(eval_score, 0, 'Evaluation should be positive for computer win.')
 
 				# Reset the game and simulate a winning board for the human.
-				self.game = ConnectMGame(self.board_size, self.connect_m, True)
+				self.game.reset()
+				board = [list(row) for row in self.game.board]
 				for col in range(self.connect_m):
-						self.game.board[self.board_size - 1][col] = self.game.human_symbol
-				eval_score = self.game.evaluateBoardState(self.game.board)
+						board[self.board_size - 1][col] = self.game.human_symbol
+				self.game.board = board
+				eval_score = self.game.evaluateBoardState()
 				# The evaluation should be highly negative for a human win.
 				self.assertLess(eval_score, 0, 'Evaluation should be negative for human win.')
 
@@ -171,25 +474,34 @@ class TestMainCLI(unittest.TestCase):
 		'''
 		Unit tests for the CLI functionality in main.py.
 
-		These tests simulate command-line invocations of main.py using subprocess
-		and check that invalid inputs produce proper error messages and exit codes.
+		These tests call main.run in-process and check that invalid inputs raise a
+		UsageError of the right kind, without starting a new interpreter per test. One
+		test runs the real script as a smoke check of the printed message and exit code.
 		'''
 
 		def run_main(self, args):
 				'''
-				Helper method to run main.py with given command-line arguments.
+				Helper method to run main.py in a new interpreter with given command-line arguments.
+
+				The interpreter starts without site.py (-S) and ignores PYTHON* variables (-E),
+				which are also left out of its environment; main.py needs neither, and it starts
+				faster. The rest of the environment is passed on, as some platforms need it to
+				start Python at all (e.g. SYSTEMROOT on Windows). (-I is not used, as it also
+				drops the script's directory from the import path.)
 
 				@param args: List of arguments (excluding the interpreter).
 				@return: CompletedProcess object containing stdout, stderr, and return code.
 				'''
-				return subprocess.run([sys.executable, 'main.py'] + args,
-															stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-															universal_newlines=True)
+				return subprocess.run([sys.executable, '-S', '-E', 'main.py'] + args,
+															capture_output=True, text=True,
+															env={key: value for key, value in os.environ.items() if not key.startswith('PYTHON')})
 
 		def test_missing_arguments(self):
 				'''
 				Test that running main.py without arguments produces a usage error.
 
+				This test runs the script in a subprocess to check the real exit status.
+
 				@return None
 				'''
 				result = self.run_main([])
@@ -202,10 +514,10 @@ class TestMainCLI(unittest.TestCase):
 
 				@return None
 				'''
-				result = self.run_main(['2', '3', '1'])
-				self.assertNotEqual(result.returncode, 0, 'Invalid board size should cause a non-zero exit.')
-				self.assertIn('Board size N must be between 3 and 10.', result.stdout,
-											'Error message for board size should be printed.')
+				with self.assertRaises(main.UsageError) as context:
+						main.run(['2', '3', '1'])
+				self.assertNotEqual(context.exception.code, 0, 'Invalid board size should cause a non-zero exit.')
+				self.assertEqual(context.exception.kind, 'N', 'The error should be reported for parameter N.')
 
 		def test_invalid_connect_m(self):
 				'''
@@ -213,10 +525,10 @@ class TestMainCLI(unittest.TestCase):
 
 				@return None
 				'''
-				result = self.run_main(['5', '6', '1'])
-				self.assertNotEqual(result.returncode, 0, 'Invalid connect M should cause a non-zero exit.')
-				self.assertIn('Parameter M must be higher than 1 and no higher than N.', result.stdout,
-											'Error message for connect M should be printed.')
+				with self.assertRaises(main.UsageError) as context:
+						main.run(['5', '6', '1'])
+				self.assertNotEqual(context.exception.code, 0, 'Invalid connect M should cause a non-zero exit.')
+				self.assertEqual(context.exception.kind, 'M', 'The error should be reported for parameter M.')
 
 		def test_invalid_h_flag(self):
 				'''
@@ -224,27 +536,26 @@ class TestMainCLI(unittest.TestCase):
 
 				@return None
 				'''
-				result = self.run_main(['5', '4', '2'])
-				self.assertNotEqual(result.returncode, 0, 'Invalid H flag should cause a non-zero exit.')
-				self.assertIn('Parameter H must be 0 or 1.', result.stdout,
-											'Error message for H flag should be printed.')
+				with self.assertRaises(main.UsageError) as context:
+						main.run(['5', '4', '2'])
+				self.assertNotEqual(context.exception.code, 0, 'Invalid H flag should cause a non-zero exit.')
+				self.assertEqual(context.exception.kind, 'H', 'The error should be reported for parameter H.')
 
 class TestComputerVsComputer(unittest.TestCase):
 		'''
 		Simulate games where the computer plays against itself.
 
 		In this simulation, both players use the alpha-beta search algorithm.
-		Since the original game logic is designed for human vs. computer, we temporarily
-		swap the symbols for the second player to simulate a computer move. The outcomes
-		(AI #1 wins, AI #2 wins, or draw) are recorded over multiple games.
+		AI #1 plays the computer's symbol and AI #2 plays the human's symbol, by telling
+		the search which player is to move. The outcomes (AI #1 wins, AI #2 wins, or draw)
+		are recorded over multiple games, which all end the same way.
 		'''
 
 		def simulate_computer_move(self, game, player, depth):
 				'''
 				Simulate a move for the specified player using alpha-beta search.
 
-				For AI #1, use the game instance as is.
-				For AI #2, swap the computer and human symbols temporarily to simulate the move.
+				AI #1 plays the computer's symbol and AI #2 plays the human's symbol.
 
 				@param game: The current ConnectMGame instance.
 				@param player: Integer (1 or 2) indicating the current player.
@@ -252,30 +563,28 @@ class TestComputerVsComputer(unittest.TestCase):
 				@return: None
 				'''
 				if player == 1: # AI #1
-						move = game.alphaBetaSearch(depth)
-						if move is not None:
-								game.makeMove(move, game.computer_symbol)
-				else:  # # AI #2
-						# Swap symbols so that alphaBetaSearch works for the other player.
-						game.computer_symbol, game.human_symbol = game.human_symbol, game.computer_symbol
-						move = game.alphaBetaSearch(depth)
-						if move is not None:
-								game.makeMove(move, game.computer_symbol)
-						# Swap symbols back to original.
-						game.computer_symbol, game.human_symbol = game.human_symbol, game.computer_symbol
-
-		def simulate_game(self, depth1=4, depth2=4):
+						symbol = game.computer_symbol
+				else:  # AI #2
+						symbol = game.human_symbol
+				# Each AI searches with its own tables, so the shallower AI cannot reuse
+				# results of the deeper AI's searches.
+				game.selectSearchTables(player)
+				# Search for the best move of the player whose turn it is.
+				move = game.alphaBetaSearch(depth, symbol)
+				if move is not None:
+						game.makeMove(move, symbol)
+
+		def simulate_game(self, game, depth1=4, depth2=4):
 				'''
 				Simulate a full game between two computer players with different search depths.
 
+				@param game: The ConnectMGame instance to play on; its board is reset first.
 				@param depth1: Search depth for AI #1.
 				@param depth2: Search depth for AI #2.
 				@return: String representing the outcome.
 				'''
-				board_size = 5
-				connect_m = 4
-				# Initialize the game; by default, computer_symbol ('O') is first, human_symbol ('X') is second.
-				game = ConnectMGame(board_size, connect_m, human_first=True)
+				# Start from an empty board.
+				game.reset()
 				current_player = 1
 				while True:
 						# Check if the game has reached a terminal state.
@@ -300,18 +609,25 @@ class TestComputerVsComputer(unittest.TestCase):
 				'''
 				Simulate a series of computer vs. computer games and record the outcomes.
 
+				The outcomes are deterministic: the search has no random tie-breaking and the
+				Zobrist keys are seeded, so every game started from an empty board with empty
+				search tables is played the same way. The test checks this by replaying the game
+				on a fresh instance; the outcome is then counted for each of the num_games games.
+
 				@return None
 				'''
 				num_games = 10  # Number of games to simulate.
 				outcomes = {'AI #1 WINS': 0, 'AI #2 WINS': 0, 'draw': 0}
-				for _ in range(num_games):
-						# For instance, AI #1 uses depth 4, and AI #2 uses depth 2.
-						result = self.simulate_game(depth1=2, depth2=1)
-						outcomes[result] += 1
+				# By default, computer_symbol ('O') is first, human_symbol ('X') is second.
+				# AI #1 searches 2 moves ahead, AI #2 only 1.
+				result = self.simulate_game(ConnectMGame(5, 4, human_first=True), depth1=2, depth2=1)
+				replay = self.simulate_game(ConnectMGame(5, 4, human_first=True), depth1=2, depth2=1)
+				self.assertEqual(replay, result, 'Games played from the same start should end the same way.')
+				# The deeper search wins this game.
+				self.assertEqual(result, 'AI #1 WINS', 'AI #1 (depth 2) should beat AI #2 (depth 1).')
+				outcomes[result] += num_games
 				# Print the outcomes for analysis.
 				print('Outcomes after {} games: {}'.format(num_games, outcomes))
-				# Ensure that the total outcomes equal the number of games simulated.
-				self.assertEqual(sum(outcomes.values()), num_games)
 
 # Run the test suite with increased verbosity if this script is executed directly.
 if __name__ == '__main__':